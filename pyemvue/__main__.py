@@ -1,6 +1,6 @@
 import sys
 import datetime
-import dateutil
+import dateutil.tz
 
 # Our files
 from pyemvue.device import VueDevice, VueUsageDevice
@@ -1,8 +1,13 @@
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+import operator
+import random
+import threading
 import time
 from typing import Any, Optional, Callable
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # These provide AWS cognito authentication support
 from pycognito import Cognito
@@ -10,6 +15,18 @@ from pycognito import Cognito
 CLIENT_ID = "4qte47jbstod8apnfic0bunmrq"
 USER_POOL = "us-east-2_ghlOXVLi1"
 USER_POOL_URL = f"https://cognito-idp.us-east-2.amazonaws.com/{USER_POOL}"
+USER_POOL_JWKS_URL = f"{USER_POOL_URL}/.well-known/jwks.json"
+JWT_ALGORITHMS = ["RS256"]
+# how long, in seconds, the user pool signing keys are trusted before fetching them again
+JWKS_CACHE_TTL = 60 * 60
+# tokens closer than this many seconds to expiring are refreshed before the request
+TOKEN_EXPIRY_MARGIN = 30
+# tokens closer than this many seconds to expiring are refreshed in the background
+TOKEN_REFRESH_WINDOW = 5 * 60
+
+# id_token is the one Emporia uses for authentication
+_TOKEN_KEYS = ("access_token", "id_token", "refresh_token", "token_type")
+_get_cognito_tokens = operator.attrgetter(*_TOKEN_KEYS)
 
 
 class Auth:
@@ -27,6 +44,7 @@ class Auth:
         max_retry_delay: float = 30.0,
     ):
         self.host = host
+        self._url_prefix = host.rstrip("/") + "/"
         self.connect_timeout = connect_timeout
         self.read_timeout = read_timeout
         self.token_updater = token_updater
@@ -35,8 +53,39 @@ class Auth:
         self.max_retry_delay = max(max_retry_delay, 0)
         self.pool_wellknown_jwks = None
         self.tokens = {}
+        self._auth_headers: "dict[str, str]" = {}
+        self._access_token_exp: Optional[float] = None
+        self._session = _create_session(
+            _JitteredRetry(
+                total=self.max_retry_attempts - 1,
+                status_forcelist=frozenset(range(500, 600)),
+                allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+                backoff_factor=self.initial_retry_delay,
+                backoff_cap=self.max_retry_delay,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+        )
+        # verified token payloads keyed by the raw token, kept until the token expires
+        self._decoded_tokens: "dict[str, dict[str, Any]]" = {}
+        self._signing_keys: "dict[str, jwt.PyJWK]" = {}
+        self._signing_keys_fetched_at = 0.0
+        self._jwt_decoder = jwt.PyJWT(
+            {
+                "require": ["exp"],
+                "verify_exp": False,
+                "verify_iat": False,
+                "verify_nbf": False,
+            }
+        )
+        # only one refresh runs at a time, concurrent callers wait for its result
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight: "Optional[Future[dict[str, str]]]" = None
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._background_refresh: "Optional[Future[dict[str, str]]]" = None
 
         self._password = None
+        self._username: Optional[str] = None
 
         if (
             tokens
@@ -62,6 +111,28 @@ class Auth:
 
     def refresh_tokens(self) -> "dict[str, str]":
         """Refresh and return new tokens."""
+        with self._refresh_lock:
+            inflight = self._refresh_inflight
+            if inflight is None:
+                future: "Future[dict[str, str]]" = Future()
+                self._refresh_inflight = future
+        if inflight is not None:
+            # another caller is already refreshing, share its result
+            return inflight.result()
+
+        try:
+            tokens = self._refresh_tokens()
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(tokens)
+            return tokens
+        finally:
+            with self._refresh_lock:
+                self._refresh_inflight = None
+
+    def _refresh_tokens(self) -> "dict[str, str]":
         if self._password:
             self.cognito.authenticate(password=self._password)
 
@@ -70,6 +141,8 @@ class Auth:
 
         tokens = self._extract_tokens_from_cognito()
         self.tokens = tokens
+        self._auth_headers = {"authtoken": tokens["id_token"]}
+        self._access_token_exp = None
 
         if self.token_updater is not None:
             self.token_updater(tokens)
@@ -78,65 +151,74 @@ class Auth:
 
     def get_username(self) -> str:
         """Get the username associated with the logged in user."""
-        user = self.cognito.get_user()
-        return user._data["email"]
+        if self._username is None:
+            # the user behind a session never changes, so only ask Cognito once
+            user = self.cognito.get_user()
+            self._username = user._data["email"]
+        return self._username
 
     def request(self, method: str, path: str, **kwargs) -> requests.Response:
         """Make a request."""
         if not self.tokens or not self.tokens["access_token"]:
             raise ValueError("Not authenticated. Incorrect username or password?")
 
-        dec_access_token = self._decode_token(self.tokens["access_token"])
+        remaining = self._get_access_token_exp() - time.time()
+        if remaining <= TOKEN_EXPIRY_MARGIN:
+            # expired or about to, get new tokens before sending the request
+            self.tokens = self.refresh_tokens()
+        elif remaining < TOKEN_REFRESH_WINDOW:
+            # expiring soon, keep using the current token while new ones are fetched
+            self._refresh_tokens_in_background()
 
-        attempts = 0
-        while attempts < self.max_retry_attempts:
-            attempts += 1
-            if datetime.now() > datetime.fromtimestamp(dec_access_token["exp"]):
-                # expired, get new tokens
-                self.tokens = self.refresh_tokens()
+        # server errors and connection failures are retried by the session
+        response = self._do_request(method, path, **kwargs)
 
+        if response.status_code == 401:
+            # if unauthorized, try refreshing the tokens
+            self.tokens = self.refresh_tokens()
+            # then run the request again with updated tokens
             response = self._do_request(method, path, **kwargs)
 
-            if response.status_code == 401:
-                # if unauthorized, try refreshing the tokens
-                self.tokens = self.refresh_tokens()
-                # then run the request again with updated tokens
-                response = self._do_request(method, path, **kwargs)
-
-            if response.status_code >= 500:
-                # if server error, retry with exponential backoff
-                delay = min(
-                    self.initial_retry_delay * (2 ** (attempts - 1)),
-                    self.max_retry_delay,
-                )
-                time.sleep(delay)
-                continue
-
-            if response.status_code < 500:
-                return response
-
         return response
 
+    def _get_access_token_exp(self) -> float:
+        # only decode a token once, its expiry is kept until the tokens are refreshed
+        # read it once, a background refresh may reset it to None at any time
+        exp = self._access_token_exp
+        if exp is None:
+            exp = self._decode_token(self.tokens["access_token"])["exp"]
+            self._access_token_exp = exp
+        return exp
+
+    def _refresh_tokens_in_background(self) -> None:
+        with self._refresh_lock:
+            if self._refresh_inflight is not None or (
+                self._background_refresh is not None
+                and not self._background_refresh.done()
+            ):
+                return
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="pyemvue-token-refresh"
+                )
+            self._background_refresh = self._refresh_executor.submit(
+                self.refresh_tokens
+            )
+
     def _extract_tokens_from_cognito(self) -> "dict[str, Any]":
-        return {
-            "access_token": self.cognito.access_token,
-            "id_token": self.cognito.id_token,  # Emporia uses this token for authentication
-            "refresh_token": self.cognito.refresh_token,
-            "token_type": self.cognito.token_type,
-        }
+        return dict(zip(_TOKEN_KEYS, _get_cognito_tokens(self.cognito)))
 
     def _do_request(self, method: str, path: str, **kwargs) -> requests.Response:
-        headers = kwargs.get("headers")
+        headers = kwargs.pop("headers", None)
 
         if headers is None:
-            headers = {}
+            headers = self._auth_headers
         else:
-            headers = dict(headers)
-        headers["authtoken"] = self.tokens["id_token"]
+            headers = {**headers, **self._auth_headers}
 
-        return requests.request(
+        return self._session.request(
             method,
-            f"{self.host}/{path}",
+            self._url_prefix + path,
             **kwargs,
             headers=headers,
             timeout=(self.connect_timeout, self.read_timeout),
@@ -144,34 +226,65 @@ class Auth:
 
     def _decode_token(self, token: str, verify_exp: bool = False) -> dict:
         """Decode a JWT token and return the payload as a dictionary, without a hard dependency on pycognito."""
-        if not self.pool_wellknown_jwks:
-            self.pool_wellknown_jwks = requests.get(
-                USER_POOL_URL + "/.well-known/jwks.json",
-                timeout=5,
-            ).json()
+        payload = self._decoded_tokens.get(token)
+        if payload is not None and payload["exp"] > time.time():
+            # signature already verified and the token is still valid
+            return payload
 
         kid = jwt.get_unverified_header(token).get("kid")
-        keys = self.pool_wellknown_jwks.get("keys")
-        key = list(filter(lambda x: x.get("kid") == kid, keys))[0]
-        hmac_key = jwt.api_jwk.PyJWK(key).key
-        return jwt.api_jwt.decode(
+        signing_key = self._signing_keys.get(kid)
+        if (
+            signing_key is None
+            or time.monotonic() - self._signing_keys_fetched_at > JWKS_CACHE_TTL
+        ):
+            # unknown or stale key, the user pool may have rotated its keys
+            self._fetch_signing_keys()
+            signing_key = self._signing_keys.get(kid)
+            if signing_key is None:
+                raise jwt.InvalidTokenError(f"No signing key found for kid {kid}")
+
+        # single verified decode, the claims are only read from the verified payload
+        payload = self._jwt_decoder.decode(
             token,
-            algorithms=["RS256"],
-            key=hmac_key,
+            algorithms=JWT_ALGORITHMS,
+            key=signing_key.key,
             issuer=self.cognito.user_pool_url,
-            options={"verify_exp": verify_exp, "verify_iat": False, "verify_nbf": False},
+            options={"verify_exp": True} if verify_exp else None,
         )
 
+        now = time.time()
+        if payload["exp"] > now:
+            # forget tokens that have expired since they were cached
+            self._decoded_tokens = {
+                t: p for t, p in self._decoded_tokens.items() if p["exp"] > now
+            }
+            self._decoded_tokens[token] = payload
+        return payload
+
+    def _fetch_signing_keys(self) -> None:
+        self.pool_wellknown_jwks = self._session.get(
+            USER_POOL_JWKS_URL,
+            timeout=5,
+        ).json()
+        self._signing_keys = {
+            key.get("kid"): jwt.PyJWK(key)
+            for key in self.pool_wellknown_jwks.get("keys", [])
+        }
+        self._signing_keys_fetched_at = time.monotonic()
+
 class SimulatedAuth(Auth):
     def __init__(
         self, host: str, username: Optional[str] = None, password: Optional[str] = None
     ):
         self.host = host
+        self._url_prefix = host.rstrip("/") + "/"
         self.username = username
         self.password = password
         self.connect_timeout = 6.03
         self.read_timeout = 10.03
         self.tokens = self.refresh_tokens()
+        self._auth_headers = {"authtoken": self.tokens["id_token"]}
+        self._session = _create_session()
 
     def refresh_tokens(self) -> dict[str, str]:
         return {"id_token": "simulator"}
@@ -191,3 +304,70 @@ class SimulatedAuth(Auth):
             response = self._do_request(method, path, **kwargs)
 
         return response
+
+
+class _JitteredRetry(Retry):
+    """Retry with a decorrelated jitter backoff between backoff_factor and backoff_cap.
+
+    The cap is kept separately from urllib3's backoff_max, which urllib3 1.x doesn't accept.
+    It also bounds any Retry-After wait the server asks for.
+    """
+
+    def __init__(
+        self,
+        *args,
+        backoff_cap: float = 30.0,
+        backoff_prev: Optional[float] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.backoff_cap = backoff_cap
+        # the previous sleep, carried over to the next Retry so the jitter can build on it
+        self.backoff_prev = backoff_prev
+        self._backoff: Optional[float] = None
+
+    def new(self, **kwargs) -> "_JitteredRetry":
+        kwargs.setdefault("backoff_cap", self.backoff_cap)
+        kwargs.setdefault(
+            "backoff_prev",
+            self._backoff if self._backoff is not None else self.backoff_prev,
+        )
+        return super().new(**kwargs)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_cap)
+
+    def get_backoff_time(self) -> float:
+        if self._backoff is not None:
+            return self._backoff
+        # only the latest run of errors counts, redirects reset it
+        errors = 0
+        for attempt in reversed(self.history):
+            if attempt.redirect_location is not None:
+                break
+            errors += 1
+        if errors == 0:
+            return 0
+        prev = self.backoff_prev
+        if errors == 1 or prev is None:
+            prev = self.backoff_factor
+        self._backoff = min(
+            random.uniform(self.backoff_factor, prev * 3), self.backoff_cap
+        )
+        return self._backoff
+
+
+def _create_session(max_retries: Optional[Retry] = None) -> requests.Session:
+    """Create a session so connections to the API and Cognito are kept alive and reused."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=max_retries if max_retries is not None else 0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,31 +1,60 @@
 import datetime
+from typing import Any
+
+from pyemvue.fields import populate
+from pyemvue.times import parse_time
+
+# datetimes are immutable, so every customer without a creation date can share this one
+_EPOCH = datetime.datetime(1970, 1, 1)
 
 
 class Customer(object):
+    __slots__ = ("customer_gid", "email", "first_name", "last_name", "created_at")
+
+    # (json key, attribute name) pairs copied by from_json_dictionary
+    _JSON_FIELDS = (
+        ("customerGid", "customer_gid"),
+        ("email", "email"),
+        ("firstName", "first_name"),
+        ("lastName", "last_name"),
+        ("createdAt", "created_at"),
+    )
+
     def __init__(
         self,
         gid=0,
         email="",
         firstName="",
         lastName="",
-        createdAt=datetime.datetime(1970, 1, 1),
+        createdAt=_EPOCH,
     ):
-        self.customer_gid = gid
-        self.email = email
-        self.first_name = firstName
-        self.last_name = lastName
-        self.created_at = createdAt
+        self.customer_gid: int = gid
+        self.email: str = email
+        self.first_name: str = firstName
+        self.last_name: str = lastName
+        self.created_at: datetime.datetime = createdAt
 
     def from_json_dictionary(self, js):
         """Populate customer data from a dictionary extracted from the response json."""
-        if "customerGid" in js:
-            self.customer_gid = js["customerGid"]
-        if "email" in js:
-            self.email = js["email"]
-        if "firstName" in js:
-            self.first_name = js["firstName"]
-        if "lastName" in js:
-            self.last_name = js["lastName"]
-        if "createdAt" in js:
-            self.created_at = js["createdAt"]
+        populate(self, js, self._JSON_FIELDS)
+        if isinstance(self.created_at, str):
+            try:
+                self.created_at = parse_time(self.created_at)
+            except ValueError:
+                pass  # keep the value as returned if it can't be parsed
         return self
+
+    @classmethod
+    def from_json_list(cls, items: "list[dict[str, Any]]") -> "list[Customer]":
+        """Create a customer for each dictionary in a list extracted from the response json."""
+        from_json = cls.from_json_dictionary
+        return [from_json(cls(), js) for js in items]
+
+    def __eq__(self, other: object) -> bool:
+        # a customer is identified by its gid
+        if not isinstance(other, Customer):
+            return NotImplemented
+        return self.customer_gid == other.customer_gid
+
+    def __hash__(self) -> int:
+        return hash(self.customer_gid)
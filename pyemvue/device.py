@@ -1,10 +1,83 @@
 import datetime
 from typing import Any, Optional
 from typing_extensions import Self
-from dateutil.parser import parse
+
+from pyemvue.fields import intern_strings, populate, to_json
+from pyemvue.times import parse_time
+
+# offline_since for devices that have never been reported offline
+_DT_MIN = datetime.datetime.min
 
 
 class VueDevice(object):
+    __slots__ = (
+        "device_gid",
+        "manufacturer_id",
+        "model",
+        "firmware",
+        "parent_device_gid",
+        "parent_channel_num",
+        "channels",
+        "outlet",
+        "ev_charger",
+        "connected",
+        "offline_since",
+        "device_name",
+        "display_name",
+        "zip_code",
+        "time_zone",
+        "usage_cent_per_kw_hour",
+        "peak_demand_dollar_per_kw",
+        "billing_cycle_start_day",
+        "solar",
+        "air_conditioning",
+        "heat_source",
+        "location_sqft",
+        "num_electric_cars",
+        "location_type",
+        "num_people",
+        "swimming_pool",
+        "hot_tub",
+        "latitude",
+        "longitude",
+        "utility_rate_gid",
+    )
+
+    # (json key, attribute name) pairs copied by from_json_dictionary
+    _JSON_FIELDS = (
+        ("deviceGid", "device_gid"),
+        ("manufacturerDeviceId", "manufacturer_id"),
+        ("model", "model"),
+        ("firmware", "firmware"),
+        ("parentDeviceGid", "parent_device_gid"),
+        ("parentChannelNum", "parent_channel_num"),
+    )
+    _LOCATION_FIELDS = (
+        ("deviceName", "device_name"),
+        ("displayName", "display_name"),
+        ("zipCode", "zip_code"),
+        ("timeZone", "time_zone"),
+        ("usageCentPerKwHour", "usage_cent_per_kw_hour"),
+        ("peakDemandDollarPerKw", "peak_demand_dollar_per_kw"),
+        ("billingCycleStartDay", "billing_cycle_start_day"),
+        ("solar", "solar"),
+        ("utilityRateGid", "utility_rate_gid"),
+    )
+    _LOCATION_INFORMATION_FIELDS = (
+        ("airConditioning", "air_conditioning"),
+        ("heatSource", "heat_source"),
+        ("locationSqFt", "location_sqft"),
+        ("numElectricCars", "num_electric_cars"),
+        ("locationType", "location_type"),
+        ("numPeople", "num_people"),
+        ("swimmingPool", "swimming_pool"),
+        ("hotTub", "hot_tub"),
+    )
+    _LATITUDE_LONGITUDE_FIELDS = (
+        ("latitude", "latitude"),
+        ("longitude", "longitude"),
+    )
+
     def __init__(self, gid=0, manId="", modelNum="", firmwareVersion=""):
         self.device_gid: int = gid
         self.manufacturer_id = manId
@@ -17,7 +90,7 @@ class VueDevice(object):
         self.ev_charger: Optional[ChargerDevice] = None
 
         self.connected: bool = False
-        self.offline_since = datetime.datetime.min
+        self.offline_since = _DT_MIN
 
         # extra info
         self.device_name = ""
@@ -42,91 +115,74 @@ class VueDevice(object):
 
     def from_json_dictionary(self, js: "dict[str, Any]") -> Self:
         """Populate device data from a dictionary extracted from the response json."""
-        if "deviceGid" in js:
-            self.device_gid = js["deviceGid"]
-        if "manufacturerDeviceId" in js:
-            self.manufacturer_id = js["manufacturerDeviceId"]
-        if "model" in js:
-            self.model = js["model"]
-        if "firmware" in js:
-            self.firmware = js["firmware"]
-        if "parentDeviceGid" in js:
-            self.parent_device_gid = js["parentDeviceGid"]
-        if "parentChannelNum" in js:
-            self.parent_channel_num = js["parentChannelNum"]
-        if "locationProperties" in js:
-            self.populate_location_properties_from_json(js["locationProperties"])
+        populate(self, js, self._JSON_FIELDS)
+        location_properties = js.get("locationProperties")
+        if location_properties is not None:
+            self.populate_location_properties_from_json(location_properties)
         # 'devices' is empty in my system, will add support later if possible
-        if "channels" in js:
+        channels = js.get("channels")
+        if channels is not None:
             # Channels are another subtype and the channelNum is used in other calls
-            self.channels = []
-            for chnl in js["channels"]:
-                self.channels.append(VueDeviceChannel().from_json_dictionary(chnl))
+            self.channels = [
+                VueDeviceChannel().from_json_dictionary(chnl) for chnl in channels
+            ]
         # outlets are a special type
-        if "outlet" in js and js["outlet"]:
-            self.outlet = OutletDevice().from_json_dictionary(js["outlet"])
+        outlet = js.get("outlet")
+        if outlet:
+            self.outlet = OutletDevice().from_json_dictionary(outlet)
         # EVSEs are also special
-        if "evCharger" in js and js["evCharger"]:
-            self.ev_charger = ChargerDevice().from_json_dictionary(js["evCharger"])
+        ev_charger = js.get("evCharger")
+        if ev_charger:
+            self.ev_charger = ChargerDevice().from_json_dictionary(ev_charger)
 
         # Online data
-        if "deviceConnected" in js and js["deviceConnected"]:
-            con = js["deviceConnected"]
-            if "connected" in con:
-                self.connected = con["connected"]
+        con = js.get("deviceConnected")
+        if con:
+            self.connected = con.get("connected", self.connected)
+            offline_since = con.get("offlineSince")
             try:
-                if "offlineSince" in con and con["offlineSince"]:
-                    self.offline_since = parse(con["offlineSince"])
+                if offline_since:
+                    self.offline_since = parse_time(offline_since)
             except:
-                self.offline_since = datetime.datetime.min
+                self.offline_since = _DT_MIN
         return self
 
     def populate_location_properties_from_json(self, js: "dict[str, Any]"):
         """Adds the values from the get_device_properties method."""
-        if "deviceName" in js:
-            self.device_name = js["deviceName"]
-        if "displayName" in js:
-            self.display_name = js["displayName"]
-        if "zipCode" in js:
-            self.zip_code = js["zipCode"]
-        if "timeZone" in js:
-            self.time_zone = js["timeZone"]
-        if "usageCentPerKwHour" in js:
-            self.usage_cent_per_kw_hour = js["usageCentPerKwHour"]
-        if "peakDemandDollarPerKw" in js:
-            self.peak_demand_dollar_per_kw = js["peakDemandDollarPerKw"]
-        if "billingCycleStartDay" in js:
-            self.billing_cycle_start_day = js["billingCycleStartDay"]
-        if "solar" in js:
-            self.solar = js["solar"]
-        if "utilityRateGid" in js:
-            self.utility_rate_gid = js["utilityRateGid"]
-        if "locationInformation" in js and js["locationInformation"]:
-            li = js["locationInformation"]
-            if "airConditioning" in li:
-                self.air_conditioning = li["airConditioning"]
-            if "heatSource" in li:
-                self.heat_source = li["heatSource"]
-            if "locationSqFt" in li:
-                self.location_sqft = li["locationSqFt"]
-            if "numElectricCars" in li:
-                self.num_electric_cars = li["numElectricCars"]
-            if "locationType" in li:
-                self.location_type = li["locationType"]
-            if "numPeople" in li:
-                self.num_people = li["numPeople"]
-            if "swimmingPool" in li:
-                self.swimming_pool = li["swimmingPool"]
-            if "hotTub" in li:
-                self.hot_tub = li["hotTub"]
-        if "latitudeLongitude" in js and js["latitudeLongitude"]:
-            if "latitude" in js["latitudeLongitude"]:
-                self.latitude = js["latitudeLongitude"]["latitude"]
-            if "longitude" in js["latitudeLongitude"]:
-                self.longitude = js["latitudeLongitude"]["longitude"]
+        populate(self, js, self._LOCATION_FIELDS)
+        location_information = js.get("locationInformation")
+        if location_information:
+            populate(self, location_information, self._LOCATION_INFORMATION_FIELDS)
+        latitude_longitude = js.get("latitudeLongitude")
+        if latitude_longitude:
+            populate(self, latitude_longitude, self._LATITUDE_LONGITUDE_FIELDS)
 
 
 class VueDeviceChannel(object):
+    __slots__ = (
+        "device_gid",
+        "name",
+        "channel_num",
+        "channel_multiplier",
+        "channel_type_gid",
+        "nested_devices",
+        "type",
+        "parent_channel_num",
+    )
+
+    # (json key, attribute name) pairs copied by from_json_dictionary
+    _JSON_FIELDS = (
+        ("deviceGid", "device_gid"),
+        ("name", "name"),
+        ("channelNum", "channel_num"),
+        ("channelMultiplier", "channel_multiplier"),
+        ("channelTypeGid", "channel_type_gid"),
+        ("type", "type"),
+        ("parentChannelNum", "parent_channel_num"),
+    )
+    # as_dictionary sends back every field it reads
+    _AS_DICT_FIELDS = _JSON_FIELDS
+
     def __init__(
         self,
         gid=0,
@@ -146,38 +202,19 @@ class VueDeviceChannel(object):
 
     def from_json_dictionary(self, js: "dict[str, Any]") -> Self:
         """Populate device channel data from a dictionary extracted from the response json."""
-        if "deviceGid" in js:
-            self.device_gid = js["deviceGid"]
-        if "name" in js:
-            self.name = js["name"]
-        if "channelNum" in js:
-            self.channel_num = js["channelNum"]
-        if "channelMultiplier" in js:
-            self.channel_multiplier = js["channelMultiplier"]
-        if "channelTypeGid" in js:
-            self.channel_type_gid = js["channelTypeGid"]
-        if "type" in js:
-            self.type = js["type"]
-        if "parentChannelNum" in js:
-            self.parent_channel_num = js["parentChannelNum"]
+        populate(self, js, self._JSON_FIELDS)
         return self
     
     # Known types: Main, FiftyAmp, FiftyAmpBidirectional
 
     def as_dictionary(self) -> "dict[str, Any]":
         """Returns a dictionary of the device channel data."""
-        return {
-            "deviceGid": self.device_gid,
-            "name": self.name,
-            "channelNum": self.channel_num,
-            "channelMultiplier": self.channel_multiplier,
-            "channelTypeGid": self.channel_type_gid,
-            "type": self.type,
-            "parentChannelNum": self.parent_channel_num
-        }
+        return to_json(self, self._AS_DICT_FIELDS)
 
 
 class VueUsageDevice(VueDevice):
+    __slots__ = ("timestamp",)
+
     def __init__(self, gid=0, timestamp: Optional[datetime.datetime] = None):
         super().__init__(gid=gid)
         self.timestamp = timestamp
@@ -186,19 +223,32 @@ class VueUsageDevice(VueDevice):
     def from_json_dictionary(self, js: "dict[str, Any]") -> Self:
         if not js:
             return self
-        if "deviceGid" in js:
-            self.device_gid = js["deviceGid"]
-        if "channelUsages" in js and js["channelUsages"]:
-            for channel in js["channelUsages"]:
-                if channel:
-                    populated_channel = VueDeviceChannelUsage(
-                        timestamp=self.timestamp
-                    ).from_json_dictionary(channel)
-                    self.channels[populated_channel.channel_num] = populated_channel
+        self.device_gid = js.get("deviceGid", self.device_gid)
+        channel_usages = js.get("channelUsages")
+        if channel_usages:
+            timestamp = self.timestamp
+            populated_channels = (
+                VueDeviceChannelUsage._from_json(channel, timestamp)
+                for channel in channel_usages
+                if channel
+            )
+            self.channels = {
+                channel.channel_num: channel for channel in populated_channels
+            }
         return self
 
 
 class VueDeviceChannelUsage(VueDeviceChannel):
+    __slots__ = ("usage", "percentage", "timestamp")
+
+    _JSON_FIELDS = (
+        ("name", "name"),
+        ("deviceGid", "device_gid"),
+        ("channelNum", "channel_num"),
+        ("usage", "usage"),
+        ("percentage", "percentage"),
+    )
+
     def __init__(
         self,
         gid: int = 0,
@@ -208,44 +258,67 @@ class VueDeviceChannelUsage(VueDeviceChannel):
         timestamp: Optional[datetime.datetime] = None,
     ):
         super().__init__(gid=gid, name=name, channelNum=channelNum)
-        self.name = name
-        self.device_gid: int = gid
         self.usage: float = usage
-        self.channel_num = channelNum
         self.percentage = 0.0
         self.timestamp = timestamp
-        self.nested_devices = {}
+
+    @classmethod
+    def _from_json(
+        cls, js: "dict[str, Any]", timestamp: Optional[datetime.datetime]
+    ) -> "VueDeviceChannelUsage":
+        """Create a populated channel usage without the __init__ chain, for the bulk usage path.
+
+        Every slot gets the same default as __init__ before the json is applied.
+        """
+        channel = object.__new__(cls)
+        channel.device_gid = 0
+        channel.name = ""
+        channel.channel_num = "1,2,3"
+        channel.channel_multiplier = 1.0
+        channel.channel_type_gid = 0
+        channel.nested_devices = {}
+        channel.type = ""
+        channel.parent_channel_num = None
+        channel.usage = 0
+        channel.percentage = 0.0
+        channel.timestamp = timestamp
+        return channel.from_json_dictionary(js)
 
     def from_json_dictionary(self, js: "dict[str, Any]") -> Self:
         """Populate device channel usage data from a dictionary extracted from the response json."""
         if not js:
             return self
-        if "channelUsages" in js:
-            js = js[
-                "channelUsages"
-            ]  # were given "device" level and we want to work off "channel" level
-        if "name" in js:
-            self.name = js["name"]
-        if "deviceGid" in js:
-            self.device_gid = js["deviceGid"]
-        if "channelNum" in js:
-            self.channel_num = js["channelNum"]
-        if "usage" in js:
-            self.usage = js["usage"]
-        if "percentage" in js:
-            self.percentage = js["percentage"]
+        # if given the "device" level we want to work off the "channel" level
+        js = js.get("channelUsages", js)
+        if not isinstance(js, dict):
+            # a list of channel usages has none of the channel keys, leave the defaults
+            return self
+        populate(self, js, self._JSON_FIELDS)
         # Nested device handling
-        if "nestedDevices" in js and js["nestedDevices"]:
-            for device in js["nestedDevices"]:
-                if device:
-                    populated = VueUsageDevice(
-                        timestamp=self.timestamp
-                    ).from_json_dictionary(device)
-                    self.nested_devices[populated.device_gid] = populated
+        nested_devices = js.get("nestedDevices")
+        if nested_devices:
+            timestamp = self.timestamp
+            populated_devices = (
+                VueUsageDevice(timestamp=timestamp).from_json_dictionary(device)
+                for device in nested_devices
+                if device
+            )
+            self.nested_devices = {
+                device.device_gid: device for device in populated_devices
+            }
         return self
 
 
 class OutletDevice(object):
+    __slots__ = ("device_gid", "outlet_on", "load_gid", "schedules")
+
+    _JSON_FIELDS = (
+        ("deviceGid", "device_gid"),
+        ("outletOn", "outlet_on"),
+        ("loadGid", "load_gid"),
+    )
+    _AS_DICT_FIELDS = _JSON_FIELDS
+
     def __init__(self, gid: int = 0, on: bool = False):
         self.device_gid = gid
         self.outlet_on = on
@@ -253,24 +326,62 @@ class OutletDevice(object):
         self.schedules = []
 
     def from_json_dictionary(self, js: "dict[str, Any]") -> Self:
-        if "deviceGid" in js:
-            self.device_gid = js["deviceGid"]
-        if "outletOn" in js:
-            self.outlet_on = js["outletOn"]
-        if "loadGid" in js:
-            self.load_gid = js["loadGid"]
+        populate(self, js, self._JSON_FIELDS)
         # don't have support for schedules yet
         return self
 
     def as_dictionary(self) -> "dict[str, Any]":
-        return {
-            "deviceGid": self.device_gid,
-            "outletOn": self.outlet_on,
-            "loadGid": self.load_gid,
-        }
+        return to_json(self, self._AS_DICT_FIELDS)
 
 
 class ChargerDevice(object):
+    __slots__ = (
+        "device_gid",
+        "charger_on",
+        "message",
+        "status",
+        "icon",
+        "icon_label",
+        "icon_detail_text",
+        "fault_text",
+        "charging_rate",
+        "max_charging_rate",
+        "off_peak_schedules_enabled",
+        "custom_schedules",
+        "load_gid",
+        "debug_code",
+        "pro_control_code",
+        "breaker_pin",
+    )
+
+    _JSON_FIELDS = (
+        ("deviceGid", "device_gid"),
+        ("loadGid", "load_gid"),
+        ("chargerOn", "charger_on"),
+        ("message", "message"),
+        ("status", "status"),
+        ("icon", "icon"),
+        ("iconLabel", "icon_label"),
+        ("iconDetailText", "icon_detail_text"),
+        ("faultText", "fault_text"),
+        ("chargingRate", "charging_rate"),
+        ("maxChargingRate", "max_charging_rate"),
+        ("offPeakSchedulesEnabled", "off_peak_schedules_enabled"),
+        ("debugCode", "debug_code"),
+        ("proControlCode", "pro_control_code"),
+        ("breakerPIN", "breaker_pin"),
+    )
+    # breakerPIN is only sent when set
+    _AS_DICT_FIELDS = (
+        ("deviceGid", "device_gid"),
+        ("loadGid", "load_gid"),
+        ("chargerOn", "charger_on"),
+        ("chargingRate", "charging_rate"),
+        ("maxChargingRate", "max_charging_rate"),
+    )
+    # values shared by many chargers
+    _INTERNED_FIELDS = ("status", "icon", "icon_label")
+
     def __init__(self, gid: int = 0, on: bool = False):
         self.device_gid = gid
         self.charger_on = on
@@ -290,53 +401,27 @@ class ChargerDevice(object):
         self.breaker_pin = ""
 
     def from_json_dictionary(self, js: "dict[str, Any]") -> Self:
-        if "deviceGid" in js:
-            self.device_gid = js["deviceGid"]
-        if "loadGid" in js:
-            self.load_gid = js["loadGid"]
-        if "chargerOn" in js:
-            self.charger_on = js["chargerOn"]
-        if "message" in js:
-            self.message = js["message"]
-        if "status" in js:
-            self.status = js["status"]
-        if "icon" in js:
-            self.icon = js["icon"]
-        if "iconLabel" in js:
-            self.icon_label = js["iconLabel"]
-        if "iconDetailText" in js:
-            self.icon_detail_text = js["iconDetailText"]
-        if "faultText" in js:
-            self.fault_text = js["faultText"]
-        if "chargingRate" in js:
-            self.charging_rate = js["chargingRate"]
-        if "maxChargingRate" in js:
-            self.max_charging_rate = js["maxChargingRate"]
-        if "offPeakSchedulesEnabled" in js:
-            self.off_peak_schedules_enabled = js["offPeakSchedulesEnabled"]
-        if "debugCode" in js:
-            self.debug_code = js["debugCode"]
-        if "proControlCode" in js:
-            self.pro_control_code = js["proControlCode"]
-        if "breakerPIN" in js:
-            self.breaker_pin = js["breakerPIN"]
+        populate(self, js, self._JSON_FIELDS)
+        intern_strings(self, self._INTERNED_FIELDS)
         # don't have support for schedules yet
         return self
 
     def as_dictionary(self) -> "dict[str, Any]":
-        d = {
-            "deviceGid": self.device_gid,
-            "loadGid": self.load_gid,
-            "chargerOn": self.charger_on,
-            "chargingRate": self.charging_rate,
-            "maxChargingRate": self.max_charging_rate,
-        }
+        d = to_json(self, self._AS_DICT_FIELDS)
         if self.breaker_pin:
             d["breakerPIN"] = self.breaker_pin
         return d
 
 
 class ChannelType(object):
+    __slots__ = ("channel_type_gid", "description", "selectable")
+
+    _JSON_FIELDS = (
+        ("channelTypeGid", "channel_type_gid"),
+        ("description", "description"),
+        ("selectable", "selectable"),
+    )
+
     def __init__(
         self, gid: int = 0, description: str = "", selectable: bool = False
     ) -> None:
@@ -345,16 +430,36 @@ class ChannelType(object):
         self.selectable = selectable
 
     def from_json_dictionary(self, js: "dict[str, Any]") -> Self:
-        if "channelTypeGid" in js:
-            self.channel_type_gid = js["channelTypeGid"]
-        if "description" in js:
-            self.description = js["description"]
-        if "selectable" in js:
-            self.selectable = js["selectable"]
+        populate(self, js, self._JSON_FIELDS)
         return self
 
 
 class Vehicle(object):
+    __slots__ = (
+        "vehicle_gid",
+        "vendor",
+        "api_id",
+        "display_name",
+        "load_gid",
+        "make",
+        "model",
+        "year",
+    )
+
+    _JSON_FIELDS = (
+        ("vehicleGid", "vehicle_gid"),
+        ("vendor", "vendor"),
+        ("apiId", "api_id"),
+        ("displayName", "display_name"),
+        ("loadGid", "load_gid"),
+        ("make", "make"),
+        ("model", "model"),
+        ("year", "year"),
+    )
+    _AS_DICT_FIELDS = _JSON_FIELDS
+    # values repeated across a fleet of vehicles
+    _INTERNED_FIELDS = ("vendor", "make", "model", "display_name")
+
     def __init__(
         self,
         vehicleGid=0,
@@ -376,38 +481,41 @@ class Vehicle(object):
         self.year = year
 
     def from_json_dictionary(self, js):
-        if "vehicleGid" in js:
-            self.vehicle_gid = js["vehicleGid"]
-        if "vendor" in js:
-            self.vendor = js["vendor"]
-        if "apiId" in js:
-            self.api_id = js["apiId"]
-        if "displayName" in js:
-            self.display_name = js["displayName"]
-        if "loadGid" in js:
-            self.load_gid = js["loadGid"]
-        if "make" in js:
-            self.make = js["make"]
-        if "model" in js:
-            self.model = js["model"]
-        if "year" in js:
-            self.year = js["year"]
+        populate(self, js, self._JSON_FIELDS)
+        intern_strings(self, self._INTERNED_FIELDS)
         return self
 
     def as_dictionary(self) -> "dict[str, Any]":
-        return {
-            "vehicleGid": self.vehicle_gid,
-            "vendor": self.vendor,
-            "apiId": self.api_id,
-            "displayName": self.display_name,
-            "loadGid": self.load_gid,
-            "make": self.make,
-            "model": self.model,
-            "year": self.year,
-        }
+        return to_json(self, self._AS_DICT_FIELDS)
 
 
 class VehicleStatus(object):
+    __slots__ = (
+        "vehicle_gid",
+        "vehicle_state",
+        "battery_level",
+        "battery_range",
+        "charging_state",
+        "charge_limit_percent",
+        "minutes_to_full_charge",
+        "charge_current_request",
+        "charge_current_request_max",
+    )
+
+    # read from the "settings" object of the response
+    _JSON_FIELDS = (
+        ("vehicleGid", "vehicle_gid"),
+        ("vehicleState", "vehicle_state"),
+        ("batteryLevel", "battery_level"),
+        ("batteryRange", "battery_range"),
+        ("chargingState", "charging_state"),
+        ("chargeLimitPercent", "charge_limit_percent"),
+        ("minutesToFullCharge", "minutes_to_full_charge"),
+        ("chargeCurrentRequest", "charge_current_request"),
+        ("chargeCurrentRequestMax", "charge_current_request_max"),
+    )
+    _AS_DICT_FIELDS = _JSON_FIELDS
+
     def __init__(
         self,
         vehicleGid=0,
@@ -431,40 +539,11 @@ class VehicleStatus(object):
         self.charge_current_request_max = chargeCurrentRequestMax
 
     def from_json_dictionary(self, js):
-        jsv = {}
-        if "settings" in js:
-            jsv = js["settings"]
-
-        if "vehicleGid" in jsv:
-            self.vehicle_gid = jsv["vehicleGid"]
-        if "vehicleState" in jsv:
-            self.vehicle_state = jsv["vehicleState"]
-        if "batteryLevel" in jsv:
-            self.battery_level = jsv["batteryLevel"]
-        if "batteryRange" in jsv:
-            self.battery_range = jsv["batteryRange"]
-        if "chargingState" in jsv:
-            self.charging_state = jsv["chargingState"]
-        if "chargeLimitPercent" in jsv:
-            self.charge_limit_percent = jsv["chargeLimitPercent"]
-        if "minutesToFullCharge" in jsv:
-            self.minutes_to_full_charge = jsv["minutesToFullCharge"]
-        if "chargeCurrentRequest" in jsv:
-            self.charge_current_request = jsv["chargeCurrentRequest"]
-        if "chargeCurrentRequestMax" in jsv:
-            self.charge_current_request_max = jsv["chargeCurrentRequestMax"]
+        jsv = js.get("settings", {})
+
+        populate(self, jsv, self._JSON_FIELDS)
 
         return self
 
     def as_dictionary(self) -> "dict[str, Any]":
-        return {
-            "vehicleGid": self.vehicle_gid,
-            "vehicleState": self.vehicle_state,
-            "batteryLevel": self.battery_level,
-            "batteryRange": self.battery_range,
-            "chargingState": self.charging_state,
-            "chargeLimitPercent": self.charge_limit_percent,
-            "minutesToFullCharge": self.minutes_to_full_charge,
-            "chargeCurrentRequest": self.charge_current_request,
-            "chargeCurrentRequestMax": self.charge_current_request_max,
-        }
+        return to_json(self, self._AS_DICT_FIELDS)
@@ -1,7 +1,18 @@
+import sys
 from enum import Enum
 
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
 
-class Scale(Enum):
+    class StrEnum(str, Enum):
+        """Members are also strings, like enum.StrEnum on Python 3.11+."""
+
+        def __str__(self) -> str:
+            return self.value
+
+
+class Scale(StrEnum):
     SECOND = "1S"
     MINUTE = "1MIN"
     MINUTES_15 = "15MIN"
@@ -11,8 +22,19 @@ class Scale(Enum):
     MONTH = "1MON"
     YEAR = "1Y"
 
+    @classmethod
+    def lookup(cls, value: str) -> "Scale":
+        """Get the scale for an API value, like Scale(value) without the EnumMeta call overhead."""
+        try:
+            return _SCALE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_SCALE_BY_VALUE = {scale.value: scale for scale in Scale}
 
-class Unit(Enum):
+
+class Unit(StrEnum):
     VOLTS = "Voltage"
     KWH = "KilowattHours"
     USD = "Dollars"
@@ -21,3 +43,14 @@ class Unit(Enum):
     GAS = "GallonsOfGas"
     DRIVEN = "MilesDriven"
     CARBON = "Carbon"
+
+    @classmethod
+    def lookup(cls, value: str) -> "Unit":
+        """Get the unit for an API value, like Unit(value) without the EnumMeta call overhead."""
+        try:
+            return _UNIT_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_UNIT_BY_VALUE = {unit.value: unit for unit in Unit}
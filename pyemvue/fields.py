@@ -0,0 +1,26 @@
+import sys
+from typing import Any
+
+# marks a key missing from the json, since None is a value the API does return
+MISSING = object()
+
+
+def populate(obj: Any, js: "dict[str, Any]", fields: "tuple[tuple[str, str], ...]"):
+    """Copy the values present in the json onto the attributes named by the (json key, attribute) pairs."""
+    for key, attr in fields:
+        value = js.get(key, MISSING)
+        if value is not MISSING:
+            setattr(obj, attr, value)
+
+
+def intern_strings(obj: Any, attrs: "tuple[str, ...]"):
+    """Intern the string values of the named attributes so repeated values share one object."""
+    for attr in attrs:
+        value = getattr(obj, attr)
+        if isinstance(value, str):
+            setattr(obj, attr, sys.intern(value))
+
+
+def to_json(obj: Any, fields: "tuple[tuple[str, str], ...]") -> "dict[str, Any]":
+    """Build a json dictionary from the attributes named by the (json key, attribute) pairs."""
+    return {key: getattr(obj, attr) for key, attr in fields}
@@ -3,12 +3,17 @@ from typing import Any, Optional, Union
 import requests
 import datetime
 import json
-from dateutil.parser import parse
+
+try:
+    import orjson
+except ImportError:  # optional, only used to speed up json parsing
+    orjson = None
 
 # Our files
 from pyemvue.auth import Auth, SimulatedAuth
 from pyemvue.enums import Scale, Unit
 from pyemvue.customer import Customer
+from pyemvue.times import parse_time
 from pyemvue.device import (
     ChargerDevice,
     VueDevice,
@@ -54,7 +59,7 @@ class PyEmVue(object):
         if response.status_code == 404:
             return None
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             if "msg" in j:
                 return j["msg"]
 
@@ -64,7 +69,7 @@ class PyEmVue(object):
         response.raise_for_status()
         devices: list[VueDevice] = []
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             if "devices" in j:
                 for dev in j["devices"]:
                     devices.append(VueDevice().from_json_dictionary(dev))
@@ -79,7 +84,7 @@ class PyEmVue(object):
         response = self.auth.request("get", url)
         response.raise_for_status()
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             device.populate_location_properties_from_json(j)
         return device
 
@@ -89,7 +94,7 @@ class PyEmVue(object):
         response = self.auth.request("put", url, json=channel.as_dictionary())
         response.raise_for_status()
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             channel.from_json_dictionary(j)
         return channel
 
@@ -98,7 +103,7 @@ class PyEmVue(object):
         response = self.auth.request("get", API_CUSTOMER)
         response.raise_for_status()
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             return Customer().from_json_dictionary(j)
         return None
 
@@ -141,9 +146,9 @@ class PyEmVue(object):
             attempts += 1
             response = self.auth.request("get", url)
             if response.status_code == 200 and response.text:
-                j = response.json()
+                j = _parse_json(response)
                 if "deviceListUsages" in j and "devices" in j["deviceListUsages"]:
-                    timestamp = parse(j["deviceListUsages"]["instant"])
+                    timestamp = parse_time(j["deviceListUsages"]["instant"])
                     for device in j["deviceListUsages"]["devices"]:
                         populated = VueUsageDevice(
                             timestamp=timestamp
@@ -194,9 +199,9 @@ class PyEmVue(object):
         usage: list[float] = []
         instant = start
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             if "firstUsageInstant" in j:
-                instant = parse(j["firstUsageInstant"])
+                instant = parse_time(j["firstUsageInstant"])
             if "usageList" in j:
                 usage = j["usageList"]
         return usage, instant
@@ -207,7 +212,7 @@ class PyEmVue(object):
         response.raise_for_status()
         outlets = []
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             if j and "outlets" in j and j["outlets"]:
                 for raw_outlet in j["outlets"]:
                     outlets.append(OutletDevice().from_json_dictionary(raw_outlet))
@@ -223,7 +228,7 @@ class PyEmVue(object):
 
         response = self.auth.request("put", API_OUTLET, json=outlet.as_dictionary())
         response.raise_for_status()
-        outlet.from_json_dictionary(response.json())
+        outlet.from_json_dictionary(_parse_json(response))
         return outlet
 
     def get_chargers(self) -> "list[ChargerDevice]":
@@ -232,7 +237,7 @@ class PyEmVue(object):
         response.raise_for_status()
         chargers = []
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             if j and "evChargers" in j and j["evChargers"]:
                 for raw_charger in j["evChargers"]:
                     chargers.append(ChargerDevice().from_json_dictionary(raw_charger))
@@ -252,7 +257,7 @@ class PyEmVue(object):
 
         response = self.auth.request("put", API_CHARGER, json=charger.as_dictionary())
         response.raise_for_status()
-        charger.from_json_dictionary(response.json())
+        charger.from_json_dictionary(_parse_json(response))
         return charger
 
     def get_devices_status(
@@ -264,7 +269,7 @@ class PyEmVue(object):
         chargers: list[ChargerDevice] = []
         outlets: list[OutletDevice] = []
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             if j and "evChargers" in j and j["evChargers"]:
                 for raw_charger in j["evChargers"]:
                     chargers.append(ChargerDevice().from_json_dictionary(raw_charger))
@@ -292,7 +297,7 @@ class PyEmVue(object):
         response.raise_for_status()
         channel_types: list[ChannelType] = []
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             if j:
                 for raw_channel_type in j:
                     channel_types.append(
@@ -306,7 +311,7 @@ class PyEmVue(object):
         response.raise_for_status()
         vehicles: list[Vehicle] = []
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             for veh in j:
                 vehicles.append(Vehicle().from_json_dictionary(veh))
         return vehicles
@@ -317,7 +322,7 @@ class PyEmVue(object):
         response = self.auth.request("get", url)
         response.raise_for_status()
         if response.text:
-            j = response.json()
+            j = _parse_json(response)
             return VehicleStatus().from_json_dictionary(j)
         return None
 
@@ -394,6 +399,17 @@ class PyEmVue(object):
             json.dump(tokens, f, indent=2)
 
 
+def _parse_json(response: requests.Response) -> Any:
+    """Parse the json body of a response, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # let requests decode it, so bad bodies raise the same error with or without orjson
+            pass
+    return response.json()
+
+
 def _format_time(time: datetime.datetime) -> str:
     """Convert time to utc, then format"""
     # check if aware
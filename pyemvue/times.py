@@ -0,0 +1,25 @@
+import datetime
+
+
+def _fromisoformat(value: str) -> datetime.datetime:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+# pick the fastest available parser once, at import time
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional, only used to speed up timestamp parsing
+    _parse_iso = _fromisoformat
+
+
+def parse_time(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 timestamp returned by the API, such as 2023-01-01T12:00:00Z."""
+    try:
+        return _parse_iso(value)
+    except ValueError:
+        # the fast parsers reject some forms dateutil accepts, e.g. 7 digit fractions before Python 3.11
+        from dateutil.parser import parse
+
+        return parse(value)